@@ -1,10 +1,13 @@
 import os
+from unittest.mock import MagicMock
 from copy import deepcopy
 import http
 
 import requests
 import pytest
 from django.conf import settings
+from django.test import Client
+from django.urls import get_resolver
 from django.utils import translation
 
 
@@ -100,6 +103,37 @@ def breadcrumbs():
     }
 
 
+@pytest.fixture
+def mock_cms(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(
+        'directory_cms_client.client.cms_api_client.lookup_by_slug', mock
+    )
+    return mock
+
+
+@pytest.fixture(scope='session')
+def fast_client():
+    return Client()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def load_url_resolver():
+    get_resolver().url_patterns
+
+
+@pytest.fixture(scope='session', autouse=True)
+def load_translations():
+    # loads the catalogs up front rather than in the first test to use them
+    for language_code, _ in settings.LANGUAGES:
+        translation.activate(language_code)
+    translation.deactivate()
+
+
 @pytest.fixture(autouse=True)
 def set_language_to_default():
     translation.activate(settings.LANGUAGE_CODE)
+    yield
+    # tests such as test_404_when_cms_language_unavailable activate another
+    # language without resetting it
+    translation.activate(settings.LANGUAGE_CODE)
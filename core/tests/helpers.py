@@ -1,4 +1,5 @@
 import requests
+from bs4 import BeautifulSoup
 
 
 def create_response(status_code=200, json_payload=None):
@@ -6,3 +7,25 @@ def create_response(status_code=200, json_payload=None):
     response.status_code = status_code
     response.json = lambda: json_payload or {}
     return response
+
+
+def in_body(needle, response):
+    return needle.encode() in response.content
+
+
+class LazySoup:
+    # defers parsing until the first attribute access, so a test that only
+    # checks the raw content never builds a tree
+
+    def __init__(self, content, *args, **kwargs):
+        self._content = content
+        self._args = args
+        self._kwargs = kwargs
+        self._soup = None
+
+    def __getattr__(self, name):
+        if self._soup is None:
+            self._soup = BeautifulSoup(
+                self._content, *self._args, **self._kwargs
+            )
+        return getattr(self._soup, name)
@@ -1,6 +1,9 @@
+import functools
+import html
+import re
 from unittest.mock import patch
 import pytest
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from django.urls import reverse
 
 from django.utils import translation
@@ -9,58 +12,81 @@ from django.views.generic import TemplateView
 
 from core.mixins import CMSPageMixin
 from core.mixins import GetSlugFromKwargsMixin
-from core import helpers
-from core.tests.helpers import create_response
+from core.tests.helpers import LazySoup, create_response, in_body
 
 
-test_sectors = [
-    {
-        'title': 'Aerospace',
-        'featured': True,
-        'meta': {
-            'slug': 'invest-aerospace',
-            'languages': [
-                ['en-gb', 'English'],
-                ['ar', 'العربيّة'],
-                ['de', 'Deutsch'],
-            ],
-        },
-    },
-    {
-        'title': 'Automotive',
-        'featured': True,
+BS_PARSER = 'lxml'
+
+# only build the subtrees the related content and campaign tests inspect
+RELATED_CONTENT_STRAINER = SoupStrainer(id=re.compile(
+    r'^(related-(article|page)-|campaign-|section-(one|two)-|'
+    r'selling-points-icon-)'
+))
+
+
+@functools.lru_cache(maxsize=None)
+def _href_by_id_patterns(element_id):
+    element_id = re.escape(element_id).encode()
+    return (
+        re.compile(
+            rb'\sid=["\']' + element_id + rb'["\'][^>]*\shref=["\']([^"\']*)'
+        ),
+        re.compile(
+            rb'\shref=["\']([^"\']*)["\'][^>]*\sid=["\']' +
+            element_id + rb'["\']'
+        ),
+    )
+
+
+def _href_by_id(content, element_id):
+    # avoids building a whole DOM just to read one attribute
+    for pattern in _href_by_id_patterns(element_id):
+        match = pattern.search(content)
+        if match:
+            return html.unescape(match.group(1).decode('utf-8'))
+
+
+@functools.lru_cache(maxsize=None)
+def dummy_page():
+    return {
+        'title': 'test',
         'meta': {
-            'slug': 'invest-automotive',
             'languages': [
                 ['en-gb', 'English'],
                 ['fr', 'Français'],
-                ['ja', '日本語'],
-            ],
+                ['de', 'Deutsch'],
+            ]
         },
-    },
-]
-
-dummy_page = {
-    'title': 'test',
-    'meta': {
-        'languages': [
-            ['en-gb', 'English'],
-            ['fr', 'Français'],
-            ['de', 'Deutsch'],
-        ]
-    },
-    'page_type': ''
-}
-
-
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_cms_language_switcher_one_language(mock_cms_response, rf):
-    class MyView(CMSPageMixin, TemplateView):
-
-        template_name = 'core/base.html'
-        slug = 'test'
-        active_view_name = ''
+        'page_type': ''
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def dummy_page_response():
+    return create_response(status_code=200, json_payload=dummy_page())
+
+
+class _CMSTestView(CMSPageMixin, TemplateView):
+    template_name = 'core/base.html'
+    slug = 'test'
+    active_view_name = ''
 
+
+class _ActiveNameView(_CMSTestView):
+    active_view_name = 'test'
+
+
+class _CMSKwargView(GetSlugFromKwargsMixin, CMSPageMixin, TemplateView):
+    template_name = 'core/base.html'
+    active_view_name = ''
+
+
+_cms_test_view = _CMSTestView.as_view()
+_active_name_view = _ActiveNameView.as_view()
+_cms_kwarg_view = _CMSKwargView.as_view()
+
+
+def test_cms_language_switcher_one_language(mock_cms, rf):
     page = {
         'title': 'test',
         'meta': {
@@ -71,86 +97,53 @@ def test_cms_language_switcher_one_language(mock_cms_response, rf):
         'page_type': ''
     }
 
-    mock_cms_response.return_value = helpers.create_response(
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload=page
     )
 
     request = rf.get('/')
     with translation.override('de'):
-        response = MyView.as_view()(request)
+        response = _cms_test_view(request)
 
     assert response.status_code == 200
     assert response.context_data['language_switcher']['show'] is False
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
 def test_cms_language_switcher_active_language_available(
-    mock_cms_response, rf
+    mock_cms, rf
 ):
-    class MyView(CMSPageMixin, TemplateView):
-
-        template_name = 'core/base.html'
-        slug = 'test'
-        active_view_name = ''
-
-    mock_cms_response.return_value = helpers.create_response(
-        status_code=200,
-        json_payload=dummy_page
-    )
+    mock_cms.return_value = dummy_page_response()
 
     request = rf.get('/de/')
     with translation.override('de'):
-        response = MyView.as_view()(request)
+        response = _cms_test_view(request)
 
     assert response.status_code == 200
     context = response.context_data['language_switcher']
     assert context['show'] is True
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_active_view_name(mock_cms_response, rf):
-    class TestView(CMSPageMixin, TemplateView):
-        active_view_name = 'test'
-        template_name = 'core/base.html'
-        slug = 'test'
-
-    mock_cms_response.return_value = helpers.create_response(
-        status_code=200,
-        json_payload=dummy_page
-    )
+def test_active_view_name(mock_cms, rf):
+    mock_cms.return_value = dummy_page_response()
 
     request = rf.get('/')
-    response = TestView.as_view()(request)
+    response = _active_name_view(request)
 
     assert response.status_code == 200
     assert response.context_data['active_view_name'] == 'test'
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_get_cms_page(mock_cms_response, rf):
-    class TestView(CMSPageMixin, TemplateView):
-        template_name = 'core/base.html'
-        slug = 'invest-home-page'
-        active_view_name = ''
-
-    mock_cms_response.return_value = helpers.create_response(
-        status_code=200,
-        json_payload=dummy_page
-    )
+def test_get_cms_page(mock_cms, rf):
+    mock_cms.return_value = dummy_page_response()
 
     request = rf.get('/')
-    response = TestView.as_view()(request)
+    response = _cms_test_view(request)
 
-    assert response.context_data['page'] == dummy_page
+    assert response.context_data['page'] == dummy_page()
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_get_cms_page_kwargs_slug(mock_cms_response, rf):
-    class TestView(GetSlugFromKwargsMixin, CMSPageMixin, TemplateView):
-        template_name = 'core/base.html'
-        active_view_name = ''
-
+def test_get_cms_page_kwargs_slug(mock_cms, rf):
     page = {
         'title': 'the page',
         'meta': {
@@ -160,24 +153,19 @@ def test_get_cms_page_kwargs_slug(mock_cms_response, rf):
         'page_type': ''
     }
 
-    mock_cms_response.return_value = helpers.create_response(
+    mock_cms.return_value = create_response(
             status_code=200,
             json_payload=page
         )
 
     translation.activate('en-gb')
     request = rf.get('/')
-    view = TestView.as_view()
-    response = view(request, slug='aerospace')
+    response = _cms_kwarg_view(request, slug='aerospace')
 
     assert response.context_data['page'] == page
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_404_when_cms_language_unavailable(mock_cms_response, rf):
-    class TestView(GetSlugFromKwargsMixin, CMSPageMixin, TemplateView):
-        template_name = 'core/base.html'
-
+def test_404_when_cms_language_unavailable(mock_cms, rf):
     page = {
         'title': 'the page',
         'meta': {
@@ -186,22 +174,35 @@ def test_404_when_cms_language_unavailable(mock_cms_response, rf):
         },
     }
 
-    mock_cms_response.return_value = helpers.create_response(
+    mock_cms.return_value = create_response(
             status_code=200,
             json_payload=page
         )
 
     translation.activate('fr')
     request = rf.get('/fr/')
-    view = TestView.as_view()
 
     with pytest.raises(Http404):
-        view(request, slug='aerospace')
+        _cms_kwarg_view(request, slug='aerospace')
+
+
+@pytest.fixture(scope='module')
+def article_detail_url():
+    with translation.override('en-gb'):
+        return reverse(
+            'article-detail',
+            kwargs={'topic': 'topic', 'list': 'bar', 'slug': 'foo'}
+        )
+
+
+@pytest.fixture(scope='module')
+def campaign_url():
+    with translation.override('en-gb'):
+        return reverse('campaign', kwargs={'slug': 'test-page'})
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
 def test_article_detail_page_no_related_content(
-    mock_get_page, client, settings
+    mock_cms, fast_client, article_detail_url, settings
 ):
     test_article_page_no_related_content = {
         'title': 'Test article admin title',
@@ -217,29 +218,21 @@ def test_article_detail_page_no_related_content(
         'page_type': 'InternationalArticlePage',
     }
 
-    url = reverse(
-        'article-detail',
-        kwargs={'topic': 'topic', 'list': 'bar', 'slug': 'foo'}
-    )
-
-    mock_get_page.return_value = create_response(
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload=test_article_page_no_related_content
     )
 
-    response = client.get(url)
+    response = fast_client.get(article_detail_url)
 
     assert response.status_code == 200
     assert response.template_name == ['core/article_detail.html']
 
-    assert 'Related content' not in str(response.content)
-
+    assert not in_body('Related content', response)
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_article_detail_page_related_content(
-    mock_get_page, client, settings
-):
 
+@pytest.fixture(scope='module')
+def article_related_response(fast_client, article_detail_url):
     article_page = {
         'title': 'Test article admin title',
         'article_title': 'Test article',
@@ -273,30 +266,47 @@ def test_article_detail_page_related_content(
         'page_type': 'InternationalArticlePage',
     }
 
-    url = reverse(
-        'article-detail', kwargs={
-            'topic': 'topic', 'list': 'bar', 'slug': 'foo'}
+    with translation.override('en-gb'):
+        with patch(
+            'directory_cms_client.client.cms_api_client.lookup_by_slug'
+        ) as mock_get_page:
+            mock_get_page.return_value = create_response(
+                status_code=200,
+                json_payload=article_page
+            )
+            response = fast_client.get(article_detail_url)
+
+    soup = LazySoup(
+        response.content,
+        BS_PARSER,
+        from_encoding='utf-8',
+        parse_only=RELATED_CONTENT_STRAINER,
     )
+    return response, soup
 
-    mock_get_page.return_value = create_response(
-        status_code=200,
-        json_payload=article_page
-    )
 
-    response = client.get(url)
+def test_article_detail_page_related_content(article_related_response):
+    response, _ = article_related_response
 
     assert response.status_code == 200
     assert response.template_name == ['core/article_detail.html']
 
-    assert 'Related content' in str(response.content)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    assert in_body('Related content', response)
 
-    assert soup.find(
-        id='related-article-test-one-link'
-    ).attrs['href'] == '/international/test-list/test-one/'
-    assert soup.find(
-        id='related-article-test-two-link'
-    ).attrs['href'] == '/international/test-list/test-two/'
+
+def test_article_detail_page_related_content_links(article_related_response):
+    response, _ = article_related_response
+
+    assert _href_by_id(
+        response.content, 'related-article-test-one-link'
+    ) == '/international/test-list/test-one/'
+    assert _href_by_id(
+        response.content, 'related-article-test-two-link'
+    ) == '/international/test-list/test-two/'
+
+
+def test_article_detail_page_related_content_titles(article_related_response):
+    _, soup = article_related_response
 
     assert soup.find(
         id='related-article-test-one'
@@ -306,13 +316,11 @@ def test_article_detail_page_related_content(
     ).select('h3')[0].text == 'Related article 2'
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_breadcrumbs_mixin(mock_get_page, client, settings):
-
-    url = reverse('article-detail', kwargs={
-        'topic': 'topic', 'list': 'bar', 'slug': 'foo'})
+def test_breadcrumbs_mixin(
+    mock_cms, fast_client, article_detail_url, settings
+):
 
-    mock_get_page.return_value = create_response(
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload={
             'page_type': 'InternationalArticlePage',
@@ -322,7 +330,7 @@ def test_breadcrumbs_mixin(mock_get_page, client, settings):
             },
         }
     )
-    response = client.get(url)
+    response = fast_client.get(article_detail_url)
 
     breadcrumbs = response.context_data['breadcrumbs']
     assert breadcrumbs == [
@@ -345,9 +353,8 @@ def test_breadcrumbs_mixin(mock_get_page, client, settings):
     ]
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
 def test_article_detail_page_social_share_links(
-    mock_get_page, client, settings
+    mock_cms, fast_client, article_detail_url, settings
 ):
 
     test_article_page = {
@@ -366,16 +373,12 @@ def test_article_detail_page_social_share_links(
         'page_type': 'InternationalArticlePage',
     }
 
-    url = reverse('article-detail', kwargs={
-        'topic': 'topic', 'list': 'bar', 'slug': 'foo'})
-
-    mock_get_page.return_value = create_response(
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload=test_article_page
     )
 
-    response = client.get(url)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    response = fast_client.get(article_detail_url)
 
     assert response.status_code == 200
     assert response.template_name == ['core/article_detail.html']
@@ -397,15 +400,14 @@ def test_article_detail_page_social_share_links(
         'foo/&subject=great.gov.uk%20-%20Test%20article%20'
     )
 
-    assert soup.find(id='share-twitter').attrs['href'] == twitter_link
-    assert soup.find(id='share-facebook').attrs['href'] == facebook_link
-    assert soup.find(id='share-linkedin').attrs['href'] == linkedin_link
-    assert soup.find(id='share-email').attrs['href'] == email_link
+    assert _href_by_id(response.content, 'share-twitter') == twitter_link
+    assert _href_by_id(response.content, 'share-facebook') == facebook_link
+    assert _href_by_id(response.content, 'share-linkedin') == linkedin_link
+    assert _href_by_id(response.content, 'share-email') == email_link
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
 def test_article_detail_page_social_share_links_no_title(
-    mock_get_page, client, settings
+    mock_cms, fast_client, article_detail_url, settings
 ):
 
     test_article_page = {
@@ -423,16 +425,12 @@ def test_article_detail_page_social_share_links_no_title(
         'page_type': 'InternationalArticlePage',
     }
 
-    url = reverse('article-detail', kwargs={
-        'topic': 'topic', 'list': 'bar', 'slug': 'foo'})
-
-    mock_get_page.return_value = create_response(
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload=test_article_page
     )
 
-    response = client.get(url)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    response = fast_client.get(article_detail_url)
 
     assert response.status_code == 200
     assert response.template_name == ['core/article_detail.html']
@@ -453,348 +451,409 @@ def test_article_detail_page_social_share_links_no_title(
         'great.gov.uk%20-%20%20'
     )
 
-    assert soup.find(id='share-twitter').attrs['href'] == twitter_link
-    assert soup.find(id='share-linkedin').attrs['href'] == linkedin_link
-    assert soup.find(id='share-email').attrs['href'] == email_link
-
-
-campaign_page_all_fields = {
-    'campaign_heading': 'Campaign heading',
-    'campaign_hero_image': {'url': 'campaign_hero_image.jpg'},
-    'cta_box_button_text': 'CTA box button text',
-    'cta_box_button_url': '/cta_box_button_url',
-    'cta_box_message': 'CTA box message',
-    'related_content_heading': 'Related content heading',
-    'related_content_intro': '<p>Related content intro.</p>',
-    'section_one_contact_button_text': 'Section one contact button text',
-    'section_one_contact_button_url': '/section_one_contact_button_url',
-    'section_one_heading': 'Section one heading',
-    'section_one_image': {'url': 'section_one_image.jpg'},
-    'section_one_intro': '<p>Section one intro.</p>',
-    'section_two_contact_button_text': 'Section one contact button text',
-    'section_two_contact_button_url': '/section_two_contact_button_url',
-    'section_two_heading': 'Section two heading',
-    'section_two_image': {'url': 'section_two_image.jpg'},
-    'section_two_intro': '<p>Section two intro</p>',
-    'selling_point_one_content': '<p>Selling point one content</p>',
-    'selling_point_one_heading': 'Selling point one heading',
-    'selling_point_one_icon': {'url': 'selling_point_one_icon.jpg'},
-    'selling_point_two_content': '<p>Selling point two content</p>',
-    'selling_point_two_heading': 'Selling point two heading',
-    'selling_point_two_icon': {'url': 'selling_point_two_icon.jpg'},
-    'selling_point_three_content': '<p>Selling point three content</p>',
-    'selling_point_three_heading': 'Selling point three heading',
-    'selling_point_three_icon': {'url': 'selling_point_three_icon.jpg'},
-    'related_pages': [
-        {
-            'article_image': {'url': 'article_image.jpg'},
-            'article_image_thumbnail': {'url': 'article1_image_thumbnail.jpg'},
-            'article_teaser': 'Related article description 1',
-            'article_title': 'Related article 1',
-            'full_path': '/advice/finance/article-1/',
-            'meta': {
-                'languages': [['en-gb', 'English']],
-                'slug': 'article-1'},
-            'page_type': 'InternationalArticlePage',
-            'title': 'Related article 1'
-        },
-        {
-            'article_image': {'url': 'article_image.jpg'},
-            'article_image_thumbnail': {'url': 'article2_image_thumbnail.jpg'},
-            'article_teaser': 'Related article description 2',
-            'article_title': 'Related article 2',
-            'full_path': '/advice/finance/article-2/',
-            'meta': {
-                'languages': [['en-gb', 'English']],
-                'slug': 'article-2'},
-            'page_type': 'InternationalArticlePage',
-            'title': 'Related article 2'
-        },
-        {
-            'article_image': {'url': 'article_image.jpg'},
-            'article_image_thumbnail': {'url': 'article3_image_thumbnail.jpg'},
-            'article_teaser': 'Related article description 3',
-            'article_title': 'Related article 3',
-            'full_path': '/advice/finance/article-3/',
-            'meta': {
-                'languages': [('en-gb', 'English')],
-                'slug': 'article-3'},
-            'page_type': 'InternationalArticlePage',
-            'title': 'Related article 3'
+    assert _href_by_id(response.content, 'share-twitter') == twitter_link
+    assert _href_by_id(response.content, 'share-linkedin') == linkedin_link
+    assert _href_by_id(response.content, 'share-email') == email_link
+
+
+@functools.lru_cache(maxsize=None)
+def campaign_page_all_fields():
+    return {
+        'campaign_heading': 'Campaign heading',
+        'campaign_hero_image': {'url': 'campaign_hero_image.jpg'},
+        'cta_box_button_text': 'CTA box button text',
+        'cta_box_button_url': '/cta_box_button_url',
+        'cta_box_message': 'CTA box message',
+        'related_content_heading': 'Related content heading',
+        'related_content_intro': '<p>Related content intro.</p>',
+        'section_one_contact_button_text': 'Section one contact button text',
+        'section_one_contact_button_url': '/section_one_contact_button_url',
+        'section_one_heading': 'Section one heading',
+        'section_one_image': {'url': 'section_one_image.jpg'},
+        'section_one_intro': '<p>Section one intro.</p>',
+        'section_two_contact_button_text': 'Section one contact button text',
+        'section_two_contact_button_url': '/section_two_contact_button_url',
+        'section_two_heading': 'Section two heading',
+        'section_two_image': {'url': 'section_two_image.jpg'},
+        'section_two_intro': '<p>Section two intro</p>',
+        'selling_point_one_content': '<p>Selling point one content</p>',
+        'selling_point_one_heading': 'Selling point one heading',
+        'selling_point_one_icon': {'url': 'selling_point_one_icon.jpg'},
+        'selling_point_two_content': '<p>Selling point two content</p>',
+        'selling_point_two_heading': 'Selling point two heading',
+        'selling_point_two_icon': {'url': 'selling_point_two_icon.jpg'},
+        'selling_point_three_content': '<p>Selling point three content</p>',
+        'selling_point_three_heading': 'Selling point three heading',
+        'selling_point_three_icon': {'url': 'selling_point_three_icon.jpg'},
+        'related_pages': [
+            {
+                'article_image': {'url': 'article_image.jpg'},
+                'article_image_thumbnail': {
+                    'url': 'article1_image_thumbnail.jpg'
+                },
+                'article_teaser': 'Related article description 1',
+                'article_title': 'Related article 1',
+                'full_path': '/advice/finance/article-1/',
+                'meta': {
+                    'languages': [['en-gb', 'English']],
+                    'slug': 'article-1'},
+                'page_type': 'InternationalArticlePage',
+                'title': 'Related article 1'
+            },
+            {
+                'article_image': {'url': 'article_image.jpg'},
+                'article_image_thumbnail': {
+                    'url': 'article2_image_thumbnail.jpg'
+                },
+                'article_teaser': 'Related article description 2',
+                'article_title': 'Related article 2',
+                'full_path': '/advice/finance/article-2/',
+                'meta': {
+                    'languages': [['en-gb', 'English']],
+                    'slug': 'article-2'},
+                'page_type': 'InternationalArticlePage',
+                'title': 'Related article 2'
+            },
+            {
+                'article_image': {'url': 'article_image.jpg'},
+                'article_image_thumbnail': {
+                    'url': 'article3_image_thumbnail.jpg'
+                },
+                'article_teaser': 'Related article description 3',
+                'article_title': 'Related article 3',
+                'full_path': '/advice/finance/article-3/',
+                'meta': {
+                    'languages': [('en-gb', 'English')],
+                    'slug': 'article-3'},
+                'page_type': 'InternationalArticlePage',
+                'title': 'Related article 3'
+            },
+        ],
+        'meta': {
+            'languages': [('en-gb', 'English')],
+            'slug': 'test-page'
         },
-    ],
-    'meta': {
-        'languages': [('en-gb', 'English')],
-        'slug': 'test-page'
-    },
-    'page_type': 'InternationalCampaignPage'
-}
-
-
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_marketing_campaign_campaign_page_all_fields(
-    mock_get_page, client, settings
-):
-    url = reverse('campaign', kwargs={'slug': 'test-page'})
+        'page_type': 'InternationalCampaignPage'
+    }
 
-    mock_get_page.return_value = create_response(
-        status_code=200,
-        json_payload=campaign_page_all_fields
+
+@pytest.fixture(scope='module')
+def campaign_all_response(fast_client, campaign_url):
+    with translation.override('en-gb'):
+        with patch(
+            'directory_cms_client.client.cms_api_client.lookup_by_slug'
+        ) as mock_get_page:
+            mock_get_page.return_value = create_response(
+                status_code=200,
+                json_payload=campaign_page_all_fields()
+            )
+            response = fast_client.get(campaign_url)
+
+    soup = LazySoup(
+        response.content,
+        BS_PARSER,
+        from_encoding='utf-8',
+        parse_only=RELATED_CONTENT_STRAINER,
     )
-    response = client.get(url)
+    return response, soup
+
+
+@pytest.fixture(scope='module')
+def campaign_all_by_id(campaign_all_response):
+    # one walk of the tree instead of a full scan per soup.find(id=...)
+    _, soup = campaign_all_response
+    by_id = {}
+    for element in soup.find_all(id=True):
+        by_id.setdefault(element['id'], element)
+    return by_id
+
+
+def test_marketing_campaign_campaign_page_all_fields(campaign_all_response):
+    response, _ = campaign_all_response
 
     assert response.status_code == 200
     assert response.template_name == ['core/campaign.html']
 
-    soup = BeautifulSoup(response.content, 'html.parser')
 
-    assert ('<p class="body-text">Selling point two content</p>'
-            ) in str(response.content)
+def test_marketing_campaign_campaign_page_all_fields_selling_points(
+    campaign_all_response, campaign_all_by_id
+):
+    response, _ = campaign_all_response
+    page = campaign_page_all_fields()
 
-    assert ('<p class="body-text">Selling point three content</p>'
-            ) in str(response.content)
+    assert in_body(
+        '<p class="body-text">Selling point two content</p>', response
+    )
 
-    hero_section = soup.find(id='campaign-hero')
+    assert in_body(
+        '<p class="body-text">Selling point three content</p>', response
+    )
+
+    assert campaign_all_by_id['selling-points-icon-two'].attrs['src'] == (
+        page['selling_point_two_icon']['url'])
+
+    assert campaign_all_by_id['selling-points-icon-three'].attrs['src'] == (
+        page['selling_point_three_icon']['url'])
+
+
+def test_marketing_campaign_campaign_page_all_fields_hero_image(
+    campaign_all_by_id
+):
+    hero_section = campaign_all_by_id['campaign-hero']
 
     exp_style = "background-image: url('{}')".format(
-        campaign_page_all_fields['campaign_hero_image']['url'])
+        campaign_page_all_fields()['campaign_hero_image']['url'])
 
     assert hero_section.attrs['style'] == exp_style
 
-    assert soup.find(
-        id='selling-points-icon-two').attrs['src'] == campaign_page_all_fields[
-        'selling_point_two_icon']['url']
 
-    assert soup.find(
-        id='selling-points-icon-three'
-    ).attrs['src'] == campaign_page_all_fields[
-        'selling_point_three_icon']['url']
+def test_marketing_campaign_campaign_page_all_fields_contact_buttons(
+    campaign_all_by_id
+):
+    page = campaign_page_all_fields()
 
-    assert soup.find(
-        id='section-one-contact-button'
-    ).attrs['href'] == campaign_page_all_fields[
-        'section_one_contact_button_url']
-    assert soup.find(
-        id='section-one-contact-button').text == campaign_page_all_fields[
-        'section_one_contact_button_text']
+    button = campaign_all_by_id['section-one-contact-button']
+    assert button.attrs['href'] == page['section_one_contact_button_url']
+    assert button.text == page['section_one_contact_button_text']
 
-    assert soup.find(
-        id='section-two-contact-button'
-    ).attrs['href'] == campaign_page_all_fields[
-        'section_two_contact_button_url']
-    assert soup.find(
-        id='section-two-contact-button').text == campaign_page_all_fields[
-        'section_two_contact_button_text']
-
-    related_page_one = soup.find(id='related-page-article-1')
-    assert related_page_one.find('a').text == 'Related article 1'
-    assert related_page_one.find('p').text == 'Related article description 1'
-    assert related_page_one.find('a').attrs['href'] == (
-        '/international/advice/finance/article-1/')
-    assert related_page_one.find('img').attrs['src'] == (
-        'article1_image_thumbnail.jpg')
-
-    related_page_two = soup.find(id='related-page-article-2')
-    assert related_page_two.find('a').text == 'Related article 2'
-    assert related_page_two.find('p').text == 'Related article description 2'
-    assert related_page_two.find('a').attrs['href'] == (
-        '/international/advice/finance/article-2/')
-    assert related_page_two.find('img').attrs['src'] == (
-        'article2_image_thumbnail.jpg')
-
-    related_page_three = soup.find(id='related-page-article-3')
-    assert related_page_three.find('a').text == 'Related article 3'
-    assert related_page_three.find('p').text == 'Related article description 3'
-    assert related_page_three.find('a').attrs['href'] == (
-        '/international/advice/finance/article-3/')
-    assert related_page_three.find('img').attrs['src'] == (
-        'article3_image_thumbnail.jpg')
-
-
-campaign_page_required_fields = {
-    'campaign_heading': 'Campaign heading',
-    'campaign_hero_image': None,
-    'cta_box_button_text': 'CTA box button text',
-    'cta_box_button_url': '/cta_box_button_url',
-    'cta_box_message': 'CTA box message',
-    'related_content_heading': 'Related content heading',
-    'related_content_intro': '<p>Related content intro.</p>',
-    'related_pages': [],
-    'section_one_contact_button_text': None,
-    'section_one_contact_button_url': None,
-    'section_one_heading': 'Section one heading',
-    'section_one_image': None,
-    'section_one_intro': '<p>Section one intro.</p>',
-    'section_two_contact_button_text': None,
-    'section_two_contact_button_url': None,
-    'section_two_heading': 'Section two heading',
-    'section_two_image': None,
-    'section_two_intro': '<p>Section two intro</p>',
-    'selling_point_one_content': '<p>Selling point one content</p>',
-    'selling_point_one_heading': 'Selling point one heading',
-    'selling_point_one_icon': None,
-    'selling_point_two_content': '<p>Selling point two content</p>',
-    'selling_point_two_heading': 'Selling point two heading',
-    'selling_point_two_icon': None,
-    'selling_point_three_content': '<p>Selling point three content</p>',
-    'selling_point_three_heading': 'Selling point three heading',
-    'selling_point_three_icon': None,
-    'meta': {
-        'languages': [('en-gb', 'English')],
-        'slug': 'test-page'
-    },
-    'page_type': 'InternationalCampaignPage'
-}
-
-
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_marketing_campaign_page_required_fields(
-    mock_get_page, client, settings
+    button = campaign_all_by_id['section-two-contact-button']
+    assert button.attrs['href'] == page['section_two_contact_button_url']
+    assert button.text == page['section_two_contact_button_text']
+
+
+@pytest.mark.parametrize('number', (1, 2, 3))
+def test_marketing_campaign_campaign_page_all_fields_related_pages(
+    campaign_all_by_id, number
 ):
-    url = reverse('campaign', kwargs={'slug': 'test-page'})
+    related_page = campaign_all_by_id[
+        'related-page-article-{}'.format(number)
+    ]
+    assert related_page.find('a').text == 'Related article {}'.format(number)
+    assert related_page.find('p').text == (
+        'Related article description {}'.format(number))
+    assert related_page.find('a').attrs['href'] == (
+        '/international/advice/finance/article-{}/'.format(number))
+    assert related_page.find('img').attrs['src'] == (
+        'article{}_image_thumbnail.jpg'.format(number))
+
+
+@functools.lru_cache(maxsize=None)
+def campaign_page_required_fields():
+    return {
+        'campaign_heading': 'Campaign heading',
+        'campaign_hero_image': None,
+        'cta_box_button_text': 'CTA box button text',
+        'cta_box_button_url': '/cta_box_button_url',
+        'cta_box_message': 'CTA box message',
+        'related_content_heading': 'Related content heading',
+        'related_content_intro': '<p>Related content intro.</p>',
+        'related_pages': [],
+        'section_one_contact_button_text': None,
+        'section_one_contact_button_url': None,
+        'section_one_heading': 'Section one heading',
+        'section_one_image': None,
+        'section_one_intro': '<p>Section one intro.</p>',
+        'section_two_contact_button_text': None,
+        'section_two_contact_button_url': None,
+        'section_two_heading': 'Section two heading',
+        'section_two_image': None,
+        'section_two_intro': '<p>Section two intro</p>',
+        'selling_point_one_content': '<p>Selling point one content</p>',
+        'selling_point_one_heading': 'Selling point one heading',
+        'selling_point_one_icon': None,
+        'selling_point_two_content': '<p>Selling point two content</p>',
+        'selling_point_two_heading': 'Selling point two heading',
+        'selling_point_two_icon': None,
+        'selling_point_three_content': '<p>Selling point three content</p>',
+        'selling_point_three_heading': 'Selling point three heading',
+        'selling_point_three_icon': None,
+        'meta': {
+            'languages': [('en-gb', 'English')],
+            'slug': 'test-page'
+        },
+        'page_type': 'InternationalCampaignPage'
+    }
 
-    mock_get_page.return_value = create_response(
-        status_code=200,
-        json_payload=campaign_page_required_fields
-    )
-    response = client.get(url)
+
+@pytest.fixture(scope='module')
+def campaign_required_response(fast_client, campaign_url):
+    with translation.override('en-gb'):
+        with patch(
+            'directory_cms_client.client.cms_api_client.lookup_by_slug'
+        ) as mock_get_page:
+            mock_get_page.return_value = create_response(
+                status_code=200,
+                json_payload=campaign_page_required_fields()
+            )
+            response = fast_client.get(campaign_url)
+
+    soup = LazySoup(response.content, BS_PARSER, from_encoding='utf-8')
+    return response, soup
+
+
+def test_marketing_campaign_page_required_fields(campaign_required_response):
+    response, _ = campaign_required_response
 
     assert response.status_code == 200
     assert response.template_name == ['core/campaign.html']
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    assert in_body(
+        '<p class="body-text">Selling point two content</p>', response
+    )
 
-    assert ('<p class="body-text">Selling point two content</p>'
-            ) in str(response.content)
+    assert in_body(
+        '<p class="body-text">Selling point three content</p>', response
+    )
 
-    assert ('<p class="body-text">Selling point three content</p>'
-            ) in str(response.content)
+
+def test_marketing_campaign_page_required_fields_hero_image(
+    campaign_required_response
+):
+    _, soup = campaign_required_response
 
     hero_section = soup.find(id='campaign-hero')
     assert not hero_section.attrs.get('style')
 
-    assert not soup.find(id='selling-points-icon-two')
-    assert not soup.find(id='selling-points-icon-three')
 
-    assert not soup.find(id='section-one-contact-button')
-    assert not soup.find(id='section-one-contact-button')
+def test_marketing_campaign_page_required_fields_hidden_elements(
+    campaign_required_response
+):
+    response, _ = campaign_required_response
+
+    assert not in_body('id="selling-points-icon-two"', response)
+    assert not in_body('id="selling-points-icon-three"', response)
+
+    assert not in_body('id="section-one-contact-button"', response)
+    assert not in_body('id="section-two-contact-button"', response)
+
 
-    assert not soup.find(id='section-two-contact-button')
-    assert not soup.find(id='section-two-contact-button')
+def test_marketing_campaign_page_required_fields_headings(
+    campaign_required_response
+):
+    _, soup = campaign_required_response
 
     assert soup.select(
         '#campaign-contact-box .box-heading'
-        )[0].text == campaign_page_required_fields['cta_box_message']
+        )[0].text == campaign_page_required_fields()['cta_box_message']
 
     assert soup.find(
         id='campaign-hero-heading'
-        ).text == campaign_page_required_fields['campaign_heading']
+        ).text == campaign_page_required_fields()['campaign_heading']
 
     assert soup.find(
         id='section-one-heading'
-        ).text == campaign_page_required_fields['section_one_heading']
+        ).text == campaign_page_required_fields()['section_one_heading']
 
     assert soup.find(
         id='section-two-heading'
-        ).text == campaign_page_required_fields['section_two_heading']
+        ).text == campaign_page_required_fields()['section_two_heading']
 
     assert soup.find(
         id='related-content-heading'
-        ).text == campaign_page_required_fields['related_content_heading']
+        ).text == campaign_page_required_fields()['related_content_heading']
 
     assert soup.select(
         "li[aria-current='page']"
-        )[0].text == campaign_page_required_fields['campaign_heading']
-
-
-test_child_pages = [
-    {
-        'last_published_at': '2019-02-28T10:56:30.455848Z',
-        'meta': {'slug': 'campaign-one'},
-        'page_type': 'InternationalCampaignPage',
-        'teaser': 'Campaign one teaser',
-        'title': 'Campaign one'
-    },
-    {
-        'last_published_at': '2019-02-28T10:56:31.455848Z',
-        'meta': {'slug': 'article-one'},
-        'page_type': 'InternationalArticlePage',
-        'teaser': 'Article one teaser',
-        'title': 'Article one'
-    },
-    {
-        'last_published_at': '2019-02-28T10:56:32.455848Z',
-        'meta': {'slug': 'article-two'},
-        'page_type': 'InternationalArticlePage',
-        'teaser': 'Article two teaser',
-        'title': 'Article two'
-    },
-]
-
-test_localised_child_pages = [
-    {
-        'last_published_at': '2019-02-28T10:56:30.455848Z',
-        'meta': {'slug': 'campaign-one'},
-        'page_type': 'InternationalCampaignPage',
-        'teaser': 'Campaign one teaser',
-        'title': 'Campaign one'
-    },
-    {
-        'last_published_at': '2019-02-28T10:56:31.455848Z',
-        'meta': {'slug': 'article-one'},
-        'page_type': 'InternationalArticlePage',
-        'teaser': 'Article one teaser',
-        'title': 'Article one'
-    },
-    {
-        'last_published_at': '2019-02-28T10:56:32.455848Z',
-        'meta': {'slug': 'article-two'},
-        'page_type': 'InternationalArticlePage',
-        'teaser': 'Article two teaser',
-        'title': 'Article two'
-    },
-]
-
-test_list_page = {
-    'title': 'List CMS admin title',
-    'seo_title': 'SEO title article list',
-    'search_description': 'Article list search description',
-    'landing_page_title': 'Article list landing page title',
-    'hero_image': {'url': 'article_list.png'},
-    'hero_teaser': 'Article list hero teaser',
-    'list_teaser': '<p>Article list teaser</p>',
-    'child_pages': test_child_pages,
-    'localised_child_pages': test_localised_child_pages,
-    'page_type': 'InternationalArticleListingPage',
-    'meta': {
-        'slug': 'article-list',
-        'languages': [('en-gb', 'English')],
-    },
-}
-
-
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_article_list_page(mock_get_page, client, settings):
+        )[0].text == campaign_page_required_fields()['campaign_heading']
+
+
+@functools.lru_cache(maxsize=None)
+def child_pages():
+    return [
+        {
+            'last_published_at': '2019-02-28T10:56:30.455848Z',
+            'meta': {'slug': 'campaign-one'},
+            'page_type': 'InternationalCampaignPage',
+            'teaser': 'Campaign one teaser',
+            'title': 'Campaign one'
+        },
+        {
+            'last_published_at': '2019-02-28T10:56:31.455848Z',
+            'meta': {'slug': 'article-one'},
+            'page_type': 'InternationalArticlePage',
+            'teaser': 'Article one teaser',
+            'title': 'Article one'
+        },
+        {
+            'last_published_at': '2019-02-28T10:56:32.455848Z',
+            'meta': {'slug': 'article-two'},
+            'page_type': 'InternationalArticlePage',
+            'teaser': 'Article two teaser',
+            'title': 'Article two'
+        },
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def localised_child_pages():
+    return [
+        {
+            'last_published_at': '2019-02-28T10:56:30.455848Z',
+            'meta': {'slug': 'campaign-one'},
+            'page_type': 'InternationalCampaignPage',
+            'teaser': 'Campaign one teaser',
+            'title': 'Campaign one'
+        },
+        {
+            'last_published_at': '2019-02-28T10:56:31.455848Z',
+            'meta': {'slug': 'article-one'},
+            'page_type': 'InternationalArticlePage',
+            'teaser': 'Article one teaser',
+            'title': 'Article one'
+        },
+        {
+            'last_published_at': '2019-02-28T10:56:32.455848Z',
+            'meta': {'slug': 'article-two'},
+            'page_type': 'InternationalArticlePage',
+            'teaser': 'Article two teaser',
+            'title': 'Article two'
+        },
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def list_page():
+    return {
+        'title': 'List CMS admin title',
+        'seo_title': 'SEO title article list',
+        'search_description': 'Article list search description',
+        'landing_page_title': 'Article list landing page title',
+        'hero_image': {'url': 'article_list.png'},
+        'hero_teaser': 'Article list hero teaser',
+        'list_teaser': '<p>Article list teaser</p>',
+        'child_pages': child_pages(),
+        'localised_child_pages': localised_child_pages(),
+        'page_type': 'InternationalArticleListingPage',
+        'meta': {
+            'slug': 'article-list',
+            'languages': [('en-gb', 'English')],
+        },
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def list_page_response():
+    return create_response(status_code=200, json_payload=list_page())
+
+
+def test_article_list_page(mock_cms, fast_client, settings):
 
     url = reverse('article-list', kwargs={
         'topic': 'article-topic',
         'slug': 'article-list'
     })
 
-    mock_get_page.return_value = create_response(
-        status_code=200,
-        json_payload=test_list_page
-    )
+    mock_cms.return_value = list_page_response()
 
-    response = client.get(url)
+    response = fast_client.get(url)
 
     assert response.status_code == 200
     assert response.template_name == ['core/article_list.html']
 
-    assert test_list_page['title'] not in str(response.content)
-    assert test_list_page['landing_page_title'] in str(response.content)
+    assert not in_body(list_page()['title'], response)
+    assert in_body(list_page()['landing_page_title'], response)
 
-    assert '28 February' in str(response.content)
+    assert in_body('28 February', response)
 
 
 @pytest.mark.parametrize('url,page_type,status_code', (
@@ -839,11 +898,10 @@ def test_article_list_page(mock_get_page, client, settings):
         200
     ),
 ))
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
 def test_page_url_mismatch_404(
-    mock_get_page, url, page_type, status_code, client
+    mock_cms, url, page_type, status_code, fast_client
 ):
-    mock_get_page.return_value = create_response(
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload={
             'page_type': page_type,
@@ -854,13 +912,12 @@ def test_page_url_mismatch_404(
         }
     )
 
-    response = client.get(url)
+    response = fast_client.get(url)
     assert response.status_code == status_code
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_homepage_no_related_pages(mock_get_page, client):
-    mock_get_page.return_value = create_response(
+def test_homepage_no_related_pages(mock_cms, fast_client):
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload={
             'page_type': 'InternationalHomePage',
@@ -873,13 +930,12 @@ def test_homepage_no_related_pages(mock_get_page, client):
         }
     )
 
-    response = client.get(reverse('index'))
-    assert 'News title' not in str(response.content)
+    response = fast_client.get(reverse('index'))
+    assert not in_body('News title', response)
 
 
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
-def test_homepage_related_pages(mock_get_page, client):
-    mock_get_page.return_value = create_response(
+def test_homepage_related_pages(mock_cms, fast_client):
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload={
             'page_type': 'InternationalHomePage',
@@ -907,14 +963,14 @@ def test_homepage_related_pages(mock_get_page, client):
         }
     )
 
-    response = client.get(reverse('index'))
-    assert 'News title' in str(response.content)
-    assert 'Related article title' in str(response.content)
-    assert 'Related article teaser' in str(response.content)
-    assert '/topic/list/article' in str(response.content)
-    assert 'Related campaign title' in str(response.content)
-    assert 'Related campaign teaser' in str(response.content)
-    assert '/international/campaigns/campaign' in str(response.content)
+    response = fast_client.get(reverse('index'))
+    assert in_body('News title', response)
+    assert in_body('Related article title', response)
+    assert in_body('Related article teaser', response)
+    assert in_body('/topic/list/article', response)
+    assert in_body('Related campaign title', response)
+    assert in_body('Related campaign teaser', response)
+    assert in_body('/international/campaigns/campaign', response)
 
 
 @pytest.mark.parametrize('localised_articles,total_articles', (
@@ -922,11 +978,10 @@ def test_homepage_related_pages(mock_get_page, client):
     ([1], 5),
     ([1, 2, 3, 4], 8),
 ))
-@patch('directory_cms_client.client.cms_api_client.lookup_by_slug')
 def test_article_count_with_regional_articles(
-    mock_get_page, localised_articles, total_articles, client
+    mock_cms, localised_articles, total_articles, fast_client
 ):
-    mock_get_page.return_value = create_response(
+    mock_cms.return_value = create_response(
         status_code=200,
         json_payload={
             'page_type': 'InternationalArticleListingPage',
@@ -939,7 +994,7 @@ def test_article_count_with_regional_articles(
         }
     )
     url = reverse('article-list', kwargs={'topic': 'topic', 'slug': 'slug'})
-    response = client.get(url)
-    soup = BeautifulSoup(response.content, 'html.parser')
+    response = fast_client.get(url)
+    soup = BeautifulSoup(response.content, BS_PARSER, from_encoding='utf-8')
     assert '{} articles'.format(total_articles) in soup.find(
         id='hero-description').string